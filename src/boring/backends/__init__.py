@@ -1,36 +1,83 @@
 """Backend factory for creating backend client instances."""
 
-from typing import Optional
+import atexit
+import importlib
+import threading
+from typing import Dict, Optional, Tuple
 
 from .base import BackendClient, TaskItem, BoardInfo, SectionInfo
-from .lark import LarkBackend
-from .kanban import KanbanBackend
 from .. import config
-from ..client import APIClient
+
+# Concrete backends pull in httpx and friends, so they are imported on first
+# use rather than whenever a command module imports this package.
+_LAZY_BACKENDS = {
+    "LarkBackend": ".lark",
+    "KanbanBackend": ".kanban",
+}
+
+
+def __getattr__(name: str):
+    """Import concrete backend classes on attribute access (PEP 562)."""
+    module_name = _LAZY_BACKENDS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+# Config values each backend is built from; a cached instance is only reused
+# while these are unchanged. lark_token is left out because the factory
+# fetches a fresh one on every build.
+BACKEND_CONFIG_KEYS = {
+    "lark": ("server_url", "jwt_token", "tasklist_guid", "section_guid", "solved_section_guid"),
+    "kanban": (
+        "kanban_base_url",
+        "kanban_api_key",
+        "kanban_board_id",
+        "kanban_list_id",
+        "kanban_done_list_id",
+    ),
+}
 
 
 class BackendFactory:
-    """Factory for creating backend client instances."""
+    """Factory for creating backend client instances.
+
+    Backends are created once per process, type and configuration, so their
+    HTTP connection pools stay warm across every operation in a CLI run.
+    """
+
+    _instances: Dict[Tuple, BackendClient] = {}
+    _lock = threading.Lock()
 
     @staticmethod
-    def _refresh_lark_token() -> str:
+    def _refresh_lark_token(cfg: dict) -> str:
         """Fetch a fresh Lark token from the server and update local config."""
+        from ..client import APIClient
+
         api_client = APIClient(
-            base_url=config.get_server_url(),
-            token=config.get_jwt_token(),
+            base_url=cfg.get("server_url"),
+            token=cfg.get("jwt_token"),
         )
         token_data = api_client.get_lark_token()
         fresh_token = token_data.get("access_token")
         if fresh_token:
             config.set_lark_token(fresh_token)
-        return fresh_token or config.get_lark_token()
+        return fresh_token or cfg.get("lark_token")
 
     @staticmethod
-    def create_backend(backend_type: Optional[str] = None) -> BackendClient:
-        """Create and return appropriate backend client based on configuration.
+    def create_backend(
+        backend_type: Optional[str] = None, cfg: Optional[dict] = None
+    ) -> BackendClient:
+        """Return the backend client for the configured (or given) backend type.
+
+        The first call per backend type and configuration builds the client;
+        later calls with the same settings return that instance, which is closed
+        automatically at interpreter exit.
 
         Args:
             backend_type: Override backend type from config. If None, uses config value.
+            cfg: Already loaded configuration. If None, it is read from disk.
 
         Returns:
             Configured backend client instance.
@@ -38,25 +85,51 @@ class BackendFactory:
         Raises:
             ValueError: If backend type is invalid or not configured.
         """
-        backend = backend_type or config.get_backend_type()
+        if cfg is None:
+            cfg = config.load_config()
+        backend = backend_type or config.get_backend_type(cfg)
+        key = (backend,) + tuple(cfg.get(k) for k in BACKEND_CONFIG_KEYS.get(backend, ()))
+
+        with BackendFactory._lock:
+            instance = BackendFactory._instances.get(key)
+            if instance is None:
+                instance = BackendFactory._build_backend(backend, cfg)
+                BackendFactory._instances[key] = instance
+                atexit.register(instance.close)
+        return instance
+
+    @staticmethod
+    def reset() -> None:
+        """Close and forget all cached backend instances."""
+        with BackendFactory._lock:
+            for instance in BackendFactory._instances.values():
+                instance.close()
+            BackendFactory._instances.clear()
 
+    @staticmethod
+    def _build_backend(backend: str, cfg: dict) -> BackendClient:
+        """Construct a new backend client from the given configuration."""
         if backend == "lark":
-            lark_token = BackendFactory._refresh_lark_token()
+            from .lark import LarkBackend
+
+            lark_token = BackendFactory._refresh_lark_token(cfg)
             return LarkBackend(
-                server_url=config.get_server_url(),
-                jwt_token=config.get_jwt_token(),
+                server_url=cfg.get("server_url"),
+                jwt_token=cfg.get("jwt_token"),
                 lark_token=lark_token,
-                tasklist_guid=config.get_tasklist_guid(),
-                section_guid=config.get_section_guid(),
-                solved_section_guid=config.get_solved_section_guid(),
+                tasklist_guid=cfg.get("tasklist_guid"),
+                section_guid=cfg.get("section_guid"),
+                solved_section_guid=cfg.get("solved_section_guid"),
             )
         elif backend == "kanban":
+            from .kanban import KanbanBackend
+
             return KanbanBackend(
-                base_url=config.get_kanban_base_url(),
-                api_key=config.get_kanban_api_key(),
-                board_id=config.get_kanban_board_id(),
-                list_id=config.get_kanban_list_id(),
-                done_list_id=config.get_kanban_done_list_id(),
+                base_url=cfg.get("kanban_base_url"),
+                api_key=cfg.get("kanban_api_key"),
+                board_id=cfg.get("kanban_board_id"),
+                list_id=cfg.get("kanban_list_id"),
+                done_list_id=cfg.get("kanban_done_list_id"),
             )
         else:
             raise ValueError(f"Unknown backend type: {backend}")
@@ -83,6 +156,21 @@ def get_backend() -> BackendClient:
     return BackendFactory.create_backend()
 
 
+def get_backend_from(cfg: dict) -> BackendClient:
+    """Get the backend client described by an already loaded config dict.
+
+    Args:
+        cfg: Configuration as returned by ``config.load_config()``.
+
+    Returns:
+        Backend client instance for ``cfg``'s backend type.
+
+    Raises:
+        ValueError: If backend type is invalid or not configured.
+    """
+    return BackendFactory.create_backend(cfg=cfg)
+
+
 # Export public API
 __all__ = [
     "BackendClient",
@@ -91,6 +179,7 @@ __all__ = [
     "SectionInfo",
     "BackendFactory",
     "get_backend",
+    "get_backend_from",
     "LarkBackend",
     "KanbanBackend",
 ]
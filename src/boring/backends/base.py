@@ -1,8 +1,12 @@
 """Base classes and data models for backend implementations."""
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence, TextIO, Union
+
+# Upper bound on concurrent move_task calls issued by move_tasks_batch
+MAX_MOVE_WORKERS = 32
 
 
 @dataclass
@@ -18,6 +22,23 @@ class TaskItem:
     comments: List[Dict[str, Any]] = field(default_factory=list)
     attachments: List[Dict[str, Any]] = field(default_factory=list)
 
+    def render_to(self, file_obj: TextIO, image_links: Sequence[str] = ()) -> None:
+        """Write the markdown description to an open text file.
+
+        Each entry of ``image_links`` replaces the next ``[Image]`` placeholder
+        in order, streamed piecewise instead of building a new copy of the
+        description per substitution.
+        """
+        if not image_links:
+            file_obj.write(self.description)
+            return
+
+        chunks = self.description.split("[Image]", len(image_links))
+        file_obj.write(chunks[0])
+        for link, chunk in zip(image_links, chunks[1:]):
+            file_obj.write(link)
+            file_obj.write(chunk)
+
 
 @dataclass
 class BoardInfo:
@@ -138,6 +159,46 @@ class BackendClient(ABC):
         """
         pass
 
+    def move_tasks_batch(
+        self,
+        task_ids: Sequence[str],
+        from_section_id: str,
+        to_section_id: str,
+        comments: Optional[Dict[str, Optional[str]]] = None,
+    ) -> Dict[str, Union[bool, Exception]]:
+        """Move several tasks/cards between sections.
+
+        The default implementation pipelines ``move_task`` calls over a thread
+        pool; backends with a bulk endpoint can override it with one request.
+
+        Args:
+            task_ids: Identifiers of the tasks/cards to move.
+            from_section_id: The source section/column identifier.
+            to_section_id: The destination section/column identifier.
+            comments: Optional mapping of task ID to a comment to post first.
+
+        Returns:
+            Mapping of task ID to the ``move_task`` result, or to the exception
+            it raised.
+        """
+        if not task_ids:
+            return {}
+        comments = comments or {}
+
+        def move(task_id: str) -> Union[bool, Exception]:
+            try:
+                return self.move_task(
+                    task_id=task_id,
+                    from_section_id=from_section_id,
+                    to_section_id=to_section_id,
+                    comment=comments.get(task_id),
+                )
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(MAX_MOVE_WORKERS, len(task_ids))) as executor:
+            return dict(zip(task_ids, executor.map(move, task_ids)))
+
     @abstractmethod
     def add_comment(self, task_id: str, comment: str) -> bool:
         pass
@@ -151,6 +212,9 @@ class BackendClient(ABC):
         """
         pass
 
+    def close(self) -> None:
+        """Release any resources (e.g. HTTP connection pools) held by the backend."""
+
     @abstractmethod
     def validate_config(self) -> tuple[bool, Optional[str]]:
         """Validate backend configuration.
@@ -1,10 +1,200 @@
 """Kanban (Outline) backend implementation."""
 
+import functools
+import hashlib
+import json
+import os
+import random
+import ssl
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any
+from urllib.parse import urlparse
 
 import httpx
 
+try:
+    import ijson
+except ImportError:  # pragma: no cover - depends on optional extra
+    ijson = None
+
 from .base import BackendClient, TaskItem, BoardInfo, SectionInfo
+from .. import fastjson
+from ..config import CONFIG_DIR
+
+# On-disk cache of formatted card comments, keyed by card id + comments revision
+COMMENTS_CACHE_DIR = CONFIG_DIR / "cache" / "kanban"
+COMMENTS_CACHE_TTL = 86400  # seconds
+
+# Card fields that change whenever a comment is added. Comments are a separate
+# resource and a card's updatedAt is not guaranteed to move when one is posted,
+# so cards carrying none of these always have their activities fetched.
+COMMENT_REVISION_FIELDS = ("commentCount", "lastActivityAt")
+
+# Number of cards whose details are fetched concurrently in list_tasks
+MAX_DETAIL_WORKERS = 16
+
+# Retry policy: connection failures are retried by the transport, server
+# errors (5xx) and dropped connections by _post with exponential backoff.
+CONNECT_RETRIES = 3
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.2  # seconds, doubled on each attempt
+
+# Display names for the legacy integer ``priority`` field, indexed by value
+PRIORITY_NAMES = ("None", "Low", "Medium", "High", "Urgent")
+
+# Activity name used by the Kanban API for card comments
+COMMENT_ACTIVITY_NAME = "kanban_cards.comment"
+
+# Card fields that must be present in the board payload to skip cards.info
+EMBEDDED_CARD_FIELDS = ("title", "description", "tags", "dueDate")
+
+# At least one of these must be present too, so the priority can be rendered
+EMBEDDED_PRIORITY_FIELDS = ("priorities", "priority")
+
+
+# Hosts treated as local development servers (self-signed certificates allowed)
+LOCAL_HOSTNAMES = ("localhost", "127.0.0.1", "::1")
+
+
+def _is_local_url(url: Optional[str]) -> bool:
+    """Return True if the URL points at a local development server."""
+    hostname = urlparse(url or "").hostname or ""
+    return (
+        hostname in LOCAL_HOSTNAMES
+        or hostname.endswith(".local")
+        or hostname.startswith("local.")
+    )
+
+
+@functools.lru_cache(maxsize=2)
+def _ssl_context(verify: bool) -> ssl.SSLContext:
+    """Build (once per process) the SSL context used by Kanban clients."""
+    context = ssl.create_default_context()
+    if not verify:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter before retry number ``attempt + 1``."""
+    return RETRY_BACKOFF * 2**attempt + random.uniform(0, RETRY_BACKOFF)
+
+
+def _comments_revision(card: Dict[str, Any]) -> Optional[str]:
+    """Return a key that changes whenever the card's comments do, if the card has one."""
+    markers = [card.get(field) for field in COMMENT_REVISION_FIELDS]
+    if all(marker is None for marker in markers):
+        return None
+    return "|".join(map(str, [card.get("updatedAt"), *markers]))
+
+
+def _comments_cache_path(card_id: str) -> str:
+    name = hashlib.sha1(card_id.encode("utf-8")).hexdigest()
+    return os.path.join(COMMENTS_CACHE_DIR, f"{name}.json")
+
+
+def _read_comments_cache(
+    card_id: str, revision: str
+) -> Optional[tuple[List[Dict[str, Any]], str]]:
+    """Return cached (comments, markdown) for a comments revision, if still fresh."""
+    try:
+        with open(_comments_cache_path(card_id), "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if entry.get("revision") != revision or entry.get("expires_at", 0) < time.time():
+        return None
+    return entry.get("comments", []), entry.get("markdown", "")
+
+
+def _write_comments_cache(
+    card_id: str, revision: str, comments: List[Dict[str, Any]], markdown: str
+) -> None:
+    """Store (comments, markdown) for a comments revision; failures are ignored."""
+    entry = {
+        "revision": revision,
+        "expires_at": time.time() + COMMENTS_CACHE_TTL,
+        "comments": comments,
+        "markdown": markdown,
+    }
+    try:
+        os.makedirs(COMMENTS_CACHE_DIR, exist_ok=True)
+        # Write to a temp file and rename so concurrent readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=COMMENTS_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, _comments_cache_path(card_id))
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _drop_comments_cache(card_id: str) -> None:
+    """Remove any cached comments for a card."""
+    try:
+        os.remove(_comments_cache_path(card_id))
+    except OSError:
+        pass
+
+
+class _ByteStreamReader:
+    """Minimal file-like adapter that lets ijson read an httpx byte stream."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+
+    def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect bytes vs str; don't consume data
+        if size == 0:
+            return b""
+        # An empty chunk means EOF to ijson, so skip any empty ones in between
+        for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+
+def _parse_section_cards(reader, section_id: str) -> Optional[List[Dict[str, Any]]]:
+    """Pick one list's cards out of a streamed ``boards.info`` payload.
+
+    Mirrors the full-board lookup in ``list_tasks``: the list's own cards if it
+    has any, otherwise the top-level cards for that list. Lists and top-level
+    cards are built one at a time, so only the matching ones are kept. Returns
+    None when the payload has neither, so the caller can use the full board.
+    """
+    section = None
+    top_cards: List[Dict[str, Any]] = []
+    has_top_cards = False
+    builder = None
+    builder_prefix = None
+    for prefix, event, value in ijson.parse(reader, use_float=True):
+        if builder is None:
+            if event == "start_map" and prefix in ("data.lists.item", "data.cards.item"):
+                builder = ijson.ObjectBuilder()
+                builder_prefix = prefix
+                builder.event(event, value)
+            elif event == "start_array" and prefix == "data.cards":
+                has_top_cards = True
+            continue
+        builder.event(event, value)
+        if event == "end_map" and prefix == builder_prefix:
+            item = builder.value
+            builder = None
+            if builder_prefix == "data.cards.item":
+                if item.get("listId") in (None, "", section_id):
+                    top_cards.append(item)
+            elif section is None and item.get("id") == section_id:
+                section = item
+
+    if section is not None and section.get("cards"):
+        return section["cards"]
+    if has_top_cards:
+        return top_cards
+    if section is not None and "cards" in section:
+        return []
+    return None
 
 
 class KanbanBackend(BackendClient):
@@ -32,20 +222,69 @@ class KanbanBackend(BackendClient):
         self.board_id = board_id
         self.list_id = list_id
         self.done_list_id = done_list_id
-
-    def _headers(self) -> dict:
-        """Get HTTP headers for API requests."""
-        return {
-            "Authorization": f"Bearer {self.api_key}",
+        # Per-instance caches so repeated lookups within one CLI run are free
+        self._board_cache: Dict[str, Dict[str, Any]] = {}
+        self._section_cache: Dict[tuple[str, str], List[Dict[str, Any]]] = {}
+        self._task_cache: Dict[str, TaskItem] = {}
+        # Built once; the client attaches them to every request
+        self._static_headers = {
+            "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         }
+        self._client = httpx.Client(
+            base_url=base_url or "",
+            headers=self._static_headers,
+            transport=httpx.HTTPTransport(
+                # Skip certificate checks only for local dev servers
+                verify=_ssl_context(verify=not _is_local_url(base_url)),
+                # Multiplex concurrent card requests over a single connection
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=32),
+                retries=CONNECT_RETRIES,
+            ),
+            timeout=httpx.Timeout(10.0),
+        )
+        # Shared by get_task_detail to load activities alongside the card;
+        # threads are only started once work is submitted.
+        self._activities_executor = ThreadPoolExecutor(max_workers=MAX_DETAIL_WORKERS)
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        executor = getattr(self, "_activities_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+        client = getattr(self, "_client", None)
+        if client is not None and not client.is_closed:
+            client.close()
+
+    def __enter__(self) -> "KanbanBackend":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _check_config(self) -> None:
+        if not self.base_url:
+            raise Exception("Kanban base URL not configured. Run 'boring setup' first.")
+        if not self.api_key:
+            raise Exception("Kanban API key not configured. Run 'boring setup' first.")
 
-    def _post(self, endpoint: str, data: Optional[Dict] = None) -> Dict[str, Any]:
+    def _post(
+        self, endpoint: str, data: Optional[Dict] = None, retries: int = MAX_RETRIES
+    ) -> Dict[str, Any]:
         """Make POST request to Kanban API.
 
         Args:
             endpoint: API endpoint path.
             data: Optional JSON payload.
+            retries: How many times to retry on 5xx responses or network errors.
+                Pass 0 for requests that are not safe to repeat.
 
         Returns:
             JSON response as dictionary.
@@ -53,23 +292,26 @@ class KanbanBackend(BackendClient):
         Raises:
             httpx.HTTPStatusError: If the request fails.
         """
-        if not self.base_url:
-            raise Exception("Kanban base URL not configured. Run 'boring setup' first.")
-        if not self.api_key:
-            raise Exception("Kanban API key not configured. Run 'boring setup' first.")
+        self._check_config()
 
-        with httpx.Client(verify=False) as client:  # verify=False for local dev
-            response = client.post(
-                f"{self.base_url}{endpoint}",
-                headers=self._headers(),
-                json=data or {},
-            )
-            response.raise_for_status()
-            json_data = response.json()
-            # Most Kanban APIs wrap the response in a 'data' field
-            if isinstance(json_data, dict) and "data" in json_data:
-                return json_data["data"]
-            return json_data
+        # Board payloads can be large, so encode/decode with orjson when available
+        content = fastjson.dumps(data or {})
+        for attempt in range(retries + 1):
+            try:
+                response = self._client.post(endpoint, content=content)
+            except httpx.TransportError:
+                if attempt == retries:
+                    raise
+            else:
+                if response.status_code < 500 or attempt == retries:
+                    break
+            time.sleep(_retry_delay(attempt))
+        response.raise_for_status()
+        json_data = fastjson.loads(response.content)
+        # Most Kanban APIs wrap the response in a 'data' field
+        if isinstance(json_data, dict) and "data" in json_data:
+            return json_data["data"]
+        return json_data
 
     def _map_priority(self, card_detail: Dict[str, Any]) -> Optional[str]:
         """Extract priority names from card details."""
@@ -78,71 +320,106 @@ class KanbanBackend(BackendClient):
             # Fallback for old/other format
             p = card_detail.get("priority")
             if p is not None:
-                priority_map = {0: "None", 1: "Low", 2: "Medium", 3: "High", 4: "Urgent"}
-                return priority_map.get(p, "None")
+                if isinstance(p, int) and 0 <= p < len(PRIORITY_NAMES):
+                    return PRIORITY_NAMES[p]
+                return "None"
             return None
-        
-        return ", ".join([p.get("name", "") for p in priorities if p.get("name")])
 
-    def _fetch_and_format_comments(self, card_id: str) -> tuple[List[Dict[str, Any]], str]:
-        """Fetch activities and format comments as a tree."""
+        return ", ".join(p["name"] for p in priorities if p.get("name"))
+
+    def _fetch_activities(self, card_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Fetch card activities, returning None if the request fails."""
         try:
             # API confirmed to use 'cardId' for activities
-            activities = self._post("/api/kanban.cards.activities", {"cardId": card_id})
-            
-            if not activities:
-                return [], ""
+            return self._post("/api/kanban.cards.activities", {"cardId": card_id}) or []
         except Exception as e:
             print(f"[DEBUG] Error fetching activities: {e}")
+            return None
+
+    def _fetch_and_format_comments(
+        self, card_id: str, revision: Optional[str] = None
+    ) -> tuple[List[Dict[str, Any]], str]:
+        """Fetch activities and format comments as a tree.
+
+        When a comments ``revision`` (see ``_comments_revision``) is given the
+        result is served from, and stored in, the on-disk comments cache.
+        """
+        if revision:
+            cached = _read_comments_cache(card_id, revision)
+            if cached is not None:
+                return cached
+
+        activities = self._fetch_activities(card_id)
+        if activities is None:
             return [], ""
 
+        comments, comments_markdown = self._format_comments(activities)
+        if revision:
+            _write_comments_cache(card_id, revision, comments, comments_markdown)
+        return comments, comments_markdown
+
+    def _format_comments(
+        self, activities: List[Dict[str, Any]]
+    ) -> tuple[List[Dict[str, Any]], str]:
+        """Format comment activities as a flat list and a markdown tree."""
         comments_list = []
         markdown_parts = []
 
-        # Filter and process comment activities
-        for activity in activities:
-            if activity.get("name") == "kanban_cards.comment":
-                comment_data = activity.get("data", {})
-                actor = activity.get("actor", {})
-                created_at = activity.get("createdAt", "")
-                
-                content = comment_data.get("comment", "")
-                author = actor.get("name", "Unknown")
-                replies = comment_data.get("replies", [])
-
-                # Add to flat list for compatibility
-                comments_list.append({
-                    "content": content,
-                    "author": author,
-                    "created_at": created_at,
-                    "replies": replies
-                })
-
-                # Format as tree in markdown
-                markdown_parts.append(self._format_comment_node(content, author, created_at, replies, level=0))
+        # Filter and process comment activities in a single lazy pass
+        comment_activities = (
+            activity
+            for activity in activities
+            if activity.get("name") == COMMENT_ACTIVITY_NAME
+        )
+        for activity in comment_activities:
+            comment_data = activity.get("data", {})
+            actor = activity.get("actor", {})
+            created_at = activity.get("createdAt", "")
+
+            content = comment_data.get("comment", "")
+            author = actor.get("name", "Unknown")
+            replies = comment_data.get("replies", [])
+
+            # Add to flat list for compatibility
+            comments_list.append({
+                "content": content,
+                "author": author,
+                "created_at": created_at,
+                "replies": replies
+            })
+
+            # Format as tree in markdown
+            node_parts: List[str] = []
+            self._format_comment_node(node_parts, content, author, created_at, replies, level=0)
+            markdown_parts.append("".join(node_parts))
 
         if markdown_parts:
             full_markdown = "\n\n---\n\n## Comments\n\n" + "\n".join(markdown_parts)
             return comments_list, full_markdown
-        
+
         return comments_list, ""
 
-    def _format_comment_node(self, content: str, author: str, created_at: str, replies: List[Dict[str, Any]], level: int) -> str:
-        """Recursively format a comment and its replies."""
-        indent = "  " * level
-        timestamp = created_at.split("T")[0] if "T" in created_at else created_at
-        
-        markdown = f"{indent}- **{author}** [{timestamp}]: {content}\n"
-        
-        for reply in replies:
-            r_content = reply.get("content", "")
-            r_author = reply.get("createdBy", {}).get("name", "Unknown")
-            r_created_at = reply.get("createdAt", "")
-            r_replies = reply.get("replies", [])
-            
-            markdown += self._format_comment_node(r_content, r_author, r_created_at, r_replies, level + 1)
-            
-        return markdown
+    def _format_comment_node(self, parts: List[str], content: str, author: str, created_at: str, replies: List[Dict[str, Any]], level: int) -> None:
+        """Append a comment and its reply tree to ``parts`` in depth-first order."""
+        # Explicit stack instead of recursion: no per-reply frame setup and no
+        # RecursionError on very deep threads.
+        stack = [(content, author, created_at, replies, level)]
+        while stack:
+            content, author, created_at, replies, level = stack.pop()
+            indent = "  " * level
+            timestamp = created_at.split("T")[0] if "T" in created_at else created_at
+
+            parts.append(f"{indent}- **{author}** [{timestamp}]: {content}\n")
+
+            # Push in reverse so replies are emitted in their original order
+            for reply in reversed(replies):
+                stack.append((
+                    reply.get("content", ""),
+                    reply.get("createdBy", {}).get("name", "Unknown"),
+                    reply.get("createdAt", ""),
+                    reply.get("replies", []),
+                    level + 1,
+                ))
 
     def list_boards(self) -> List[BoardInfo]:
         """List all Kanban boards."""
@@ -157,7 +434,11 @@ class KanbanBackend(BackendClient):
 
     def get_board_info(self, board_id: str) -> Dict[str, Any]:
         """Get Kanban board details including columns."""
-        return self._post("/api/kanban.boards.info", {"id": board_id})
+        board_info = self._board_cache.get(board_id)
+        if board_info is None:
+            board_info = self._post("/api/kanban.boards.info", {"id": board_id})
+            self._board_cache[board_id] = board_info
+        return board_info
 
     def list_sections(self, board_id: str) -> List[SectionInfo]:
         """List all columns in a Kanban board."""
@@ -172,43 +453,81 @@ class KanbanBackend(BackendClient):
         return sections
 
     def list_tasks(
-        self, section_id: str, labels: Optional[List[str]] = None
+        self,
+        section_id: str,
+        labels: Optional[List[str]] = None,
+        fetch_comments: bool = True,
     ) -> List[TaskItem]:
-        """List all cards in a Kanban column."""
+        """List all cards in a Kanban column.
+
+        Cards embedded in the board payload are used directly; ``cards.info``
+        is only requested for cards missing the fields needed to render them.
+        Pass ``fetch_comments=False`` to skip loading card activities.
+        """
         if not self.board_id:
             raise Exception("Kanban board ID not configured. Run 'boring setup' first.")
 
-        # Get board info to find all cards
-        board_info = self.get_board_info(self.board_id)
-
         task_items = []
-        label_filter = set(lbl.lower() for lbl in labels) if labels else None
-
-        # Try to find cards in the specified section/list
-        cards = []
-        for lst in board_info.get("lists", []):
-            if lst.get("id") == section_id:
-                cards = lst.get("cards", [])
-                break
-        
-        # Fallback to top-level cards if list-level cards not found
-        if not cards:
-            cards = board_info.get("cards", [])
-
-        for card in cards:
+        label_filter = frozenset(map(str.lower, labels)) if labels else None
+
+        cards = None
+        if ijson is not None and self.board_id not in self._board_cache:
+            cards = self._stream_section_cards(self.board_id, section_id)
+
+        # Only re-download the full board when the stream could not answer
+        if cards is None:
+            # Get board info to find all cards
+            board_info = self.get_board_info(self.board_id)
+
+            # Try to find cards in the specified section/list
+            cards = []
+            for lst in board_info.get("lists", []):
+                if lst.get("id") == section_id:
+                    cards = lst.get("cards", [])
+                    break
+
+            # Fallback to top-level cards if list-level cards not found
+            if not cards:
+                cards = board_info.get("cards", [])
+
+        cards = [
+            card
+            for card in cards
             # Filter by list/column ID (if not already filtered)
-            if card.get("listId") and card.get("listId") != section_id:
-                continue
+            if not card.get("listId") or card.get("listId") == section_id
+        ]
+
+        # Drop cards whose embedded tags already miss the label filter before
+        # making any per-card requests; cards without tags are checked later.
+        if label_filter:
+            cards = [
+                card
+                for card in cards
+                if card.get("tags") is None
+                or not label_filter.isdisjoint(map(str.lower, card["tags"]))
+            ]
 
-            # Get full task details using the helper method
-            try:
-                task_detail = self.get_task_detail(card["id"])
-            except Exception:
+        if not cards:
+            return task_items
+
+        # Card detail fetches are independent network round-trips, so run them
+        # concurrently over the shared connection pool.
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_DETAIL_WORKERS, len(cards))
+        ) as executor:
+            task_details = list(
+                executor.map(
+                    lambda card: self._task_from_card(card, fetch_comments), cards
+                )
+            )
+
+        for task_detail in task_details:
+            if task_detail is None:
                 continue
 
             # Filter by labels if specified
-            if label_filter and not any(
-                lbl.lower() in label_filter for lbl in task_detail.labels
+            if label_filter and label_filter.isdisjoint(
+                map(str.lower, task_detail.labels)
             ):
                 continue
 
@@ -216,15 +535,100 @@ class KanbanBackend(BackendClient):
 
         return task_items
 
+    def _stream_section_cards(
+        self, board_id: str, section_id: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Incrementally parse the board payload and return one list's cards.
+
+        See ``_parse_section_cards``; returns None if the payload has no cards
+        for the list. Failures are retried with the same policy as ``_post``.
+        """
+        key = (board_id, section_id)
+        if key in self._section_cache:
+            return self._section_cache[key]
+
+        self._check_config()
+        content = fastjson.dumps({"id": board_id})
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                with self._client.stream(
+                    "POST", "/api/kanban.boards.info", content=content
+                ) as response:
+                    if response.status_code < 500 or attempt == MAX_RETRIES:
+                        response.raise_for_status()
+                        reader = _ByteStreamReader(response.iter_bytes())
+                        cards = _parse_section_cards(reader, section_id)
+                        if cards is not None:
+                            self._section_cache[key] = cards
+                        return cards
+            except httpx.TransportError:
+                if attempt == MAX_RETRIES:
+                    raise
+            time.sleep(_retry_delay(attempt))
+        return None
+
+    def _task_from_card(
+        self, card: Dict[str, Any], fetch_comments: bool
+    ) -> Optional[TaskItem]:
+        """Build a task from a board card, returning None if it cannot be fetched."""
+        try:
+            if all(field in card for field in EMBEDDED_CARD_FIELDS) and any(
+                field in card for field in EMBEDDED_PRIORITY_FIELDS
+            ):
+                return self._task_from_embedded(card, fetch_comments)
+            return self.get_task_detail(card["id"])
+        except Exception:
+            return None
+
+    def _task_from_embedded(
+        self, card: Dict[str, Any], fetch_comments: bool
+    ) -> TaskItem:
+        """Build a task from a card embedded in the board payload."""
+        if fetch_comments:
+            comments, comments_markdown = self._fetch_and_format_comments(
+                card["id"], _comments_revision(card)
+            )
+        else:
+            comments, comments_markdown = [], ""
+        return self._build_task_item(card["id"], card, comments, comments_markdown)
+
     def get_task_detail(self, task_id: str) -> TaskItem:
         """Get detailed Kanban card information."""
-        # Get card details
-        card_detail = self._post("/api/kanban.cards.info", {"id": task_id})
-        # card_detail is now already the inner data because of _post wrapper logic
+        cached = self._task_cache.get(task_id)
+        if cached is not None:
+            return cached
 
-        # Get comments and activities
-        comments, comments_markdown = self._fetch_and_format_comments(task_id)
+        # Card details and activities don't depend on each other, so fetch the
+        # comments in the background while the card itself is loading.
+        activities_future = self._activities_executor.submit(self._fetch_activities, task_id)
+        try:
+            card_detail = self._post("/api/kanban.cards.info", {"id": task_id})
+        finally:
+            # card_detail is now already the inner data because of _post wrapper logic
+            activities = activities_future.result()
+
+        if activities is None:
+            comments, comments_markdown = [], ""
+        else:
+            comments, comments_markdown = self._format_comments(activities)
+            revision = _comments_revision(card_detail)
+            if revision:
+                _write_comments_cache(task_id, revision, comments, comments_markdown)
+
+        task_item = self._build_task_item(
+            task_id, card_detail, comments, comments_markdown
+        )
+        self._task_cache[task_id] = task_item
+        return task_item
 
+    def _build_task_item(
+        self,
+        task_id: str,
+        card_detail: Dict[str, Any],
+        comments: List[Dict[str, Any]],
+        comments_markdown: str,
+    ) -> TaskItem:
+        """Render card data and its comments into a TaskItem."""
         # Build markdown description
         title = card_detail.get("title", "")
         description = card_detail.get("description", "")
@@ -232,26 +636,28 @@ class KanbanBackend(BackendClient):
         due_date = card_detail.get("dueDate")
         card_labels = card_detail.get("tags", [])
 
-        full_markdown = f"# {title}\n"
-        full_markdown += "=" * (len(title) + 2) + "\n\n"
+        underline = "=" * (len(title) + 2)
+        parts = [f"# {title}\n{underline}\n\n"]
 
         if priority_str:
-            full_markdown += f"**Priority:** {priority_str}\n"
+            parts.append(f"**Priority:** {priority_str}\n")
 
         if due_date:
-            full_markdown += f"**Due Date:** {due_date}\n"
+            parts.append(f"**Due Date:** {due_date}\n")
 
         if card_labels:
-            full_markdown += f"**Labels:** {', '.join(card_labels)}\n"
-        
-        full_markdown += "\n"
+            parts.append(f"**Labels:** {', '.join(card_labels)}\n")
+
+        parts.append("\n")
 
         if description:
-            full_markdown += "## Description\n\n"
-            full_markdown += description.strip() + "\n"
+            parts.append("## Description\n\n")
+            parts.append(description.strip() + "\n")
 
         if comments_markdown:
-            full_markdown += "\n" + comments_markdown.strip() + "\n"
+            parts.append("\n" + comments_markdown.strip() + "\n")
+
+        full_markdown = "".join(parts)
 
         return TaskItem(
             id=task_id,
@@ -263,12 +669,21 @@ class KanbanBackend(BackendClient):
             comments=comments,
         )
 
+    def _invalidate_task(self, task_id: str) -> None:
+        """Drop cached data that a change to the given card makes stale."""
+        self._task_cache.pop(task_id, None)
+        self._board_cache.clear()
+        self._section_cache.clear()
+        _drop_comments_cache(task_id)
+
     def add_comment(self, task_id: str, comment: str) -> bool:
         try:
             self._post(
                 "/api/kanban.cards.comment",
                 {"cardId": task_id, "comment": comment},
+                retries=0,
             )
+            self._invalidate_task(task_id)
             return True
         except Exception:
             return False
@@ -286,6 +701,7 @@ class KanbanBackend(BackendClient):
                 self._post(
                     "/api/kanban.cards.comment",
                     {"cardId": task_id, "comment": comment},
+                    retries=0,
                 )
             self._post(
                 "/api/kanban.cards.move", {"cardId": task_id, "listId": to_section_id}
@@ -293,6 +709,8 @@ class KanbanBackend(BackendClient):
             return True
         except Exception:
             return False
+        finally:
+            self._invalidate_task(task_id)
 
     def get_backend_type(self) -> str:
         """Return backend identifier."""
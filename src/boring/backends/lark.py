@@ -1,19 +1,105 @@
 """Lark Suite backend implementation."""
 
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
 import httpx
 
 from .base import BackendClient, TaskItem, BoardInfo, SectionInfo
-from ..client import LarkClient, APIClient
+from ..client import LarkClient, APIClient, create_http_client
 
 LARK_BASE_URL = "https://open.larksuite.com/open-apis"
 
+# Number of tasks whose details are fetched concurrently in list_tasks
+MAX_DETAIL_WORKERS = 16
+
+# Display names for Lark's integer task priority, indexed by value
+PRIORITY_NAMES = ("None", "Low", "Medium", "High", "Urgent")
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_comment_time(created_at: str) -> str:
+    """Format a Lark millisecond timestamp string as local ``YYYY-MM-DD HH:MM``."""
+    return datetime.fromtimestamp(int(created_at) / 1000).strftime("%Y-%m-%d %H:%M")
+
+
+def _mention_to_markdown(mention: dict, is_code_block: bool) -> str:
+    return f"@{mention.get('userId', '')}"
+
+
+def _file_to_markdown(file: dict, is_code_block: bool) -> str:
+    file_name = file.get("name", file.get("fileToken", ""))
+    return f"[File: {file_name}]"
+
+
+def _image_to_markdown(image: dict, is_code_block: bool) -> str:
+    return f"![Image]({image.get('fileToken', '')})"
+
+
+def _gallery_to_markdown(gallery: dict, is_code_block: bool) -> str:
+    return "".join(
+        f"![Image]({img.get('fileToken', '')})" for img in gallery.get("imageList", [])
+    )
+
+
+def _divider_to_markdown(divider: dict, is_code_block: bool) -> str:
+    return "\n---\n"
+
+
+def _code_block_to_markdown(code_block: dict, is_code_block: bool) -> str:
+    language = code_block.get("language", "")
+    code = code_block.get("text", "")
+    return f"```{language}\n{code}\n```"
+
+
+def _equation_to_markdown(equation: dict, is_code_block: bool) -> str:
+    return f"$${equation.get('content', '')}$$"
+
+
+def _docs_link_to_markdown(docs_link: dict, is_code_block: bool) -> str:
+    url = docs_link.get("url", "")
+    title = docs_link.get("title", url)
+    return f"[{title}]({url})"
+
+
+# Rich text element type -> converter(element_value, is_code_block); text runs
+# and callouts are handled directly by rich_text_to_markdown
+_ELEMENT_HANDLERS = {
+    "mentionUser": _mention_to_markdown,
+    "file": _file_to_markdown,
+    "image": _image_to_markdown,
+    "gallery": _gallery_to_markdown,
+    "divider": _divider_to_markdown,
+    "codeBlock": _code_block_to_markdown,
+    "equation": _equation_to_markdown,
+    "docs_link": _docs_link_to_markdown,
+}
+
+
+class _RichTextFrame:
+    """One rich text document part-way through conversion."""
+
+    __slots__ = ("paragraphs", "lines", "paragraph_style", "elements", "line_parts")
+
+    def __init__(self, rich_text: dict):
+        self.paragraphs = iter(rich_text.get("content", []))
+        self.lines: List[str] = []
+        self.paragraph_style: dict = {}
+        self.elements = None
+        self.line_parts: List[str] = []
+
 
 def rich_text_to_markdown(rich_text: Optional[dict]) -> str:
     """Convert Lark rich text format to Markdown.
 
+    Callouts nest whole documents; instead of recursing into them, the
+    document being converted is suspended on an explicit stack and resumed
+    once the callout body is done, so nesting depth never grows the Python
+    call stack.
+
     Args:
         rich_text: Lark rich text dictionary structure.
 
@@ -23,20 +109,39 @@ def rich_text_to_markdown(rich_text: Optional[dict]) -> str:
     if not rich_text:
         return ""
 
-    content = rich_text.get("content", [])
-    markdown_lines = []
+    get_handler = _ELEMENT_HANDLERS.get
+    stack = [_RichTextFrame(rich_text)]
+
+    while stack:
+        frame = stack[-1]
+
+        if frame.elements is None:
+            paragraph = next(frame.paragraphs, None)
+            if paragraph is None:
+                # Document finished: hand its text to the suspended parent
+                text = "\n".join(frame.lines)
+                stack.pop()
+                if not stack:
+                    return text
+                stack[-1].line_parts.append(f"> {text}")
+                continue
+            frame.paragraph_style = paragraph.get("style") or {}
+            frame.line_parts = []
+            frame.elements = iter(paragraph.get("elements", []))
 
-    for paragraph in content:
-        line_parts = []
-        is_code_block = paragraph.get("style", {}).get("codeBlock")
-        is_quote = paragraph.get("style", {}).get("quote")
+        is_code_block = frame.paragraph_style.get("codeBlock")
+        append = frame.line_parts.append
+        callout_body = None
 
-        for element in paragraph.get("elements", []):
+        for element in frame.elements:
+            # Text runs dominate real documents, so they are handled inline
+            # rather than through a handler call
             if "textRun" in element:
-                text = element["textRun"].get("text", "")
-                style = element["textRun"].get("style", {})
-
-                if not is_code_block:
+                text_run = element["textRun"] or {}
+                text = text_run.get("text", "")
+                style = text_run.get("style")
+                # Plain runs (no or empty style) skip all styling lookups
+                if style and not is_code_block:
                     if style.get("bold"):
                         text = f"**{text}**"
                     if style.get("italic"):
@@ -45,79 +150,54 @@ def rich_text_to_markdown(rich_text: Optional[dict]) -> str:
                         text = f"~~{text}~~"
                     if style.get("codeInline"):
                         text = f"`{text}`"
-
-                    link = style.get("link", {})
-                    if link.get("url"):
+                    link = style.get("link")
+                    if link and link.get("url"):
                         text = f"[{text}]({link['url']})"
-
-                line_parts.append(text)
-
-            elif "mentionUser" in element:
-                user_id = element["mentionUser"].get("userId", "")
-                line_parts.append(f"@{user_id}")
-
-            elif "file" in element:
-                file_token = element["file"].get("fileToken", "")
-                file_name = element["file"].get("name", file_token)
-                line_parts.append(f"[File: {file_name}]")
-
-            elif "image" in element:
-                file_token = element["image"].get("fileToken", "")
-                line_parts.append(f"![Image]({file_token})")
-
-            elif "gallery" in element:
-                images = element["gallery"].get("imageList", [])
-                for img in images:
-                    file_token = img.get("fileToken", "")
-                    line_parts.append(f"![Image]({file_token})")
-
-            elif "divider" in element:
-                line_parts.append("\n---\n")
-
-            elif "codeBlock" in element:
-                language = element["codeBlock"].get("language", "")
-                code = element["codeBlock"].get("text", "")
-                line_parts.append(f"```{language}\n{code}\n```")
-
-            elif "callout" in element:
-                callout_content = element["callout"].get("content", {})
-                callout_text = rich_text_to_markdown(callout_content)
-                line_parts.append(f"> {callout_text}")
-
-            elif "equation" in element:
-                equation = element["equation"].get("content", "")
-                line_parts.append(f"$${equation}$$")
-
-            elif "docs_link" in element:
-                url = element["docs_link"].get("url", "")
-                title = element["docs_link"].get("title", url)
-                line_parts.append(f"[{title}]({url})")
-
-        paragraph_style = paragraph.get("style", {})
-        heading_level = paragraph_style.get("headingLevel", 0)
-
-        line = "".join(line_parts)
-
+                append(text)
+                continue
+            if "callout" in element:
+                content = (element["callout"] or {}).get("content")
+                if not content:
+                    append("> ")
+                    continue
+                # Suspend this paragraph; the body's text is appended to it
+                # when the body's frame is popped
+                callout_body = content
+                break
+            # Other elements carry a single type key; dispatch on it with one lookup
+            for key in element:
+                handler = get_handler(key)
+                if handler is not None:
+                    append(handler(element[key] or {}, is_code_block))
+                    break
+
+        if callout_body is not None:
+            stack.append(_RichTextFrame(callout_body))
+            continue
+
+        frame.elements = None
+        paragraph_style = frame.paragraph_style
+        line = "".join(frame.line_parts)
         if is_code_block:
             language = paragraph_style.get("codeLanguage", "")
             line = f"```{language}\n{line}\n```"
-        elif is_quote:
+        elif paragraph_style.get("quote"):
             line = f"> {line}"
-        elif heading_level:
-            line = f"{'#' * heading_level} {line}"
-
-        if paragraph_style.get("list"):
-            list_type = paragraph_style["list"].get("type")
-            indent_level = paragraph_style["list"].get("indentLevel", 0)
-            indent = "  " * indent_level
-            if list_type == "number":
+        else:
+            heading_level = paragraph_style.get("headingLevel", 0)
+            if heading_level:
+                line = f"{'#' * heading_level} {line}"
+
+        list_style = paragraph_style.get("list")
+        if list_style:
+            indent = "  " * list_style.get("indentLevel", 0)
+            if list_style.get("type") == "number":
                 line = f"{indent}1. {line}"
             else:
                 line = f"{indent}- {line}"
+        frame.lines.append(line)
 
-        markdown_lines.append(line)
-
-    return "\n".join(markdown_lines)
+    return ""
 
 
 class LarkBackend(BackendClient):
@@ -148,7 +228,17 @@ class LarkBackend(BackendClient):
         self.tasklist_guid = tasklist_guid
         self.section_guid = section_guid
         self.solved_section_guid = solved_section_guid
-        self._lark_client = LarkClient(access_token=lark_token) if lark_token else None
+        # One pooled HTTP/2 client shared by every LarkClient this backend creates
+        self._http = create_http_client()
+        self._lark_client = (
+            LarkClient(access_token=lark_token, http_client=self._http) if lark_token else None
+        )
+        # Serializes token refreshes when several worker threads fail at once
+        self._refresh_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the shared HTTP connection pool."""
+        self._http.close()
 
     def _get_lark_client(self) -> LarkClient:
         """Get Lark client instance."""
@@ -156,18 +246,28 @@ class LarkBackend(BackendClient):
             raise Exception("Lark token not configured. Run 'boring setup' first.")
         return self._lark_client
 
-    def _refresh_and_retry(self):
-        try:
-            api_client = APIClient(base_url=self.server_url, token=self.jwt_token)
-            token_data = api_client.get_lark_token()
-            fresh_token = token_data.get("access_token")
-            if fresh_token:
-                self.lark_token = fresh_token
-                self._lark_client = LarkClient(access_token=fresh_token)
+    def _refresh_and_retry(self, failed_client: Optional[LarkClient] = None):
+        """Refresh the Lark token, returning True if a retry is worthwhile.
+
+        If another thread has already replaced ``failed_client`` while we were
+        waiting for the lock, its new client is reused instead of refreshing again.
+        """
+        with self._refresh_lock:
+            if failed_client is not None and self._lark_client is not failed_client:
                 return True
-        except Exception:
-            pass
-        return False
+            try:
+                api_client = APIClient(base_url=self.server_url, token=self.jwt_token)
+                token_data = api_client.get_lark_token()
+                fresh_token = token_data.get("access_token")
+                if fresh_token:
+                    self.lark_token = fresh_token
+                    self._lark_client = LarkClient(
+                        access_token=fresh_token, http_client=self._http
+                    )
+                    return True
+            except Exception:
+                pass
+            return False
 
     def list_boards(self) -> List[BoardInfo]:
         """List all Lark tasklists."""
@@ -206,45 +306,74 @@ class LarkBackend(BackendClient):
         try:
             result = client.list_tasks_in_section(section_id, page_size=50)
         except Exception:
-            if self._refresh_and_retry():
+            if self._refresh_and_retry(client):
                 client = self._get_lark_client()
                 result = client.list_tasks_in_section(section_id, page_size=50)
             else:
                 raise
 
         task_items = []
-        label_filter = set(lbl.lower() for lbl in labels) if labels else None
+        label_filter = frozenset(map(str.lower, labels)) if labels else None
 
-        for item in result.get("data", {}).get("items", []):
-            task_guid = item.get("guid")
-
-            # Get full task details
-            task_detail = self.get_task_detail(task_guid)
-
-            # Filter by labels if specified
-            if label_filter and not any(
-                lbl.lower() in label_filter for lbl in task_detail.labels
-            ):
-                continue
-
-            task_items.append(task_detail)
+        task_guids = [
+            item.get("guid") for item in result.get("data", {}).get("items", [])
+        ]
+        if not task_guids:
+            return task_items
+
+        # Task fetches are independent network round-trips, so run them
+        # concurrently. Only the cheap task record is loaded up front; comments,
+        # attachments and markdown are built just for tasks passing the filter.
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_DETAIL_WORKERS, len(task_guids))
+        ) as executor:
+            cores = list(executor.map(self._get_task_core, task_guids))
+
+            survivors = []
+            for task_guid, (task_data, task_labels) in zip(task_guids, cores):
+                # Filter by labels if specified
+                if label_filter and label_filter.isdisjoint(
+                    {lbl.lower() for lbl in task_labels}
+                ):
+                    continue
+                survivors.append((task_guid, task_data, task_labels))
+
+            task_items = list(
+                executor.map(lambda core: self._enrich_task(*core), survivors)
+            )
 
         return task_items
 
     def get_task_detail(self, task_id: str) -> TaskItem:
         """Get detailed Lark task information."""
+        task_data, task_labels = self._get_task_core(task_id)
+        return self._enrich_task(task_id, task_data, task_labels)
+
+    def _get_task_core(self, task_id: str) -> tuple[Dict[str, Any], List[str]]:
+        """Fetch the task record and its labels, without comments or attachments."""
         client = self._get_lark_client()
 
         try:
             task_detail = client.get_task(task_id)
         except Exception:
-            if self._refresh_and_retry():
+            if self._refresh_and_retry(client):
                 client = self._get_lark_client()
                 task_detail = client.get_task(task_id)
             else:
                 raise
         task_data = task_detail.get("data", {}).get("task", {})
 
+        # Get labels from custom fields
+        custom_fields = task_data.get("custom_fields")
+        task_labels = [m.get("name", "") for m in custom_fields] if custom_fields else []
+        return task_data, task_labels
+
+    def _enrich_task(
+        self, task_id: str, task_data: Dict[str, Any], task_labels: List[str]
+    ) -> TaskItem:
+        """Build the full TaskItem: markdown description, comments and attachments."""
+        client = self._get_lark_client()
+
         # Extract basic info
         title = task_data.get("summary", "No title")
 
@@ -259,16 +388,18 @@ class LarkBackend(BackendClient):
 
         task_url = task_data.get("url", "")
 
-        full_markdown = f"# {title}\n\n"
+        parts = [f"# {title}\n\n"]
         if task_url:
-            full_markdown += f"**Lark:** {task_url}\n\n"
+            parts.append(f"**Lark:** {task_url}\n\n")
 
         # Add priority
         priority = task_data.get("priority")
         if priority is not None:
-            priority_map = {0: "None", 1: "Low", 2: "Medium", 3: "High", 4: "Urgent"}
-            priority_str = priority_map.get(priority, "None")
-            full_markdown += f"**Priority:** {priority_str}\n\n"
+            if isinstance(priority, int) and 0 <= priority < len(PRIORITY_NAMES):
+                priority_str = PRIORITY_NAMES[priority]
+            else:
+                priority_str = "None"
+            parts.append(f"**Priority:** {priority_str}\n\n")
         else:
             priority_str = None
 
@@ -277,45 +408,41 @@ class LarkBackend(BackendClient):
         due_date = None
         if due:
             due_date = due.get("date", "")
-            full_markdown += f"**Due:** {due_date}\n\n"
+            parts.append(f"**Due:** {due_date}\n\n")
 
         if description:
-            full_markdown += "---\n\n"
-            full_markdown += description
-
-        # Get labels from custom fields
-        task_labels = [
-            m.get("name", "") for m in task_data.get("custom_fields", [])
-        ]
+            parts.append("---\n\n")
+            parts.append(description)
 
-        # Get comments
+        # Get comments, rendering each page as it arrives
+        comments = []
         try:
-            comments_data = client.list_task_comments(task_id)
-            comments = []
-            if comments_data:
-                full_markdown += "\n\n---\n\n## Comments\n\n"
-                for comment in comments_data:
-                    comment_content = comment.get("content", "")
-                    created_at = comment.get("created_at", "")
-
-                    if created_at:
-                        try:
-                            ts = int(created_at) / 1000
-                            dt = datetime.fromtimestamp(ts)
-                            full_markdown += f"### {dt.strftime('%Y-%m-%d %H:%M')}\n\n"
-                            comments.append({
-                                "content": comment_content,
-                                "created_at": dt.strftime('%Y-%m-%d %H:%M')
-                            })
-                        except Exception:
-                            full_markdown += "### Comment\n\n"
-                            comments.append({"content": comment_content, "created_at": ""})
-                    else:
+            for comment in client.iter_task_comments(task_id):
+                if not comments:
+                    parts.append("\n\n---\n\n## Comments\n\n")
+                comment_content = comment.get("content", "")
+                created_at = comment.get("created_at", "")
+
+                if created_at:
+                    try:
+                        formatted = _format_comment_time(created_at)
+                        parts.append(f"### {formatted}\n\n")
+                        comments.append({
+                            "content": comment_content,
+                            "created_at": formatted
+                        })
+                    except Exception:
+                        parts.append("### Comment\n\n")
                         comments.append({"content": comment_content, "created_at": ""})
+                else:
+                    comments.append({"content": comment_content, "created_at": ""})
 
-                    full_markdown += f"{comment_content}\n\n"
+                parts.append(f"{comment_content}\n\n")
         except Exception:
-            comments = []
+            # Keep whatever was rendered before a later page failed
+            pass
+
+        full_markdown = "".join(parts)
 
         attachments = []
         try:
@@ -351,7 +478,7 @@ class LarkBackend(BackendClient):
             client.create_comment(task_id, comment)
             return True
         except Exception:
-            if self._refresh_and_retry():
+            if self._refresh_and_retry(client):
                 client = self._get_lark_client()
                 client.create_comment(task_id, comment)
                 return True
@@ -384,7 +511,7 @@ class LarkBackend(BackendClient):
             return False, "Lark token not configured"
 
         try:
-            self.list_boards()
+            self._get_lark_client().ping()
             return True, None
         except Exception as e:
             return False, str(e)
@@ -1,14 +1,24 @@
 """HTTP client for Boring Agents API."""
 
-from typing import Optional
+from typing import Iterator, Optional
 
 import httpx
 
+from . import fastjson
 from .config import get_jwt_token, get_server_url, get_lark_token
 
 LARK_BASE_URL = "https://open.larksuite.com/open-apis"
 
 
+def create_http_client() -> httpx.Client:
+    """Create a pooled HTTP/2 client for talking to the Lark Open API."""
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        timeout=30.0,
+    )
+
+
 class APIClient:
     """Client for interacting with the Boring Agents API."""
 
@@ -160,8 +170,14 @@ class APIClient:
 class LarkClient:
     """Client for direct Lark API calls."""
 
-    def __init__(self, access_token: Optional[str] = None):
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        http_client: Optional[httpx.Client] = None,
+    ):
         self.access_token = access_token or get_lark_token()
+        # Reuse one pooled connection across calls; callers may share theirs
+        self._http = http_client or create_http_client()
 
     def _headers(self) -> dict:
         return {
@@ -178,7 +194,7 @@ class LarkClient:
         if response.status_code >= 400:
             msg = ""
             try:
-                data = response.json()
+                data = fastjson.loads(response.content)
                 msg = data.get("msg", "")
             except Exception:
                 pass
@@ -189,128 +205,136 @@ class LarkClient:
     def list_tasklists(self, page_size: int = 50) -> dict:
         """List all tasklists."""
         self._check_token()
-        with httpx.Client() as client:
-            response = client.get(
-                f"{LARK_BASE_URL}/task/v2/tasklists",
-                headers=self._headers(),
-                params={"page_size": page_size},
-            )
-            self._check_response(response)
-            return response.json()
+        response = self._http.get(
+            f"{LARK_BASE_URL}/task/v2/tasklists",
+            headers=self._headers(),
+            params={"page_size": page_size},
+        )
+        self._check_response(response)
+        return fastjson.loads(response.content)
+
+    def ping(self) -> None:
+        """Cheaply confirm the token works by requesting a single tasklist."""
+        self._check_token()
+        response = self._http.get(
+            f"{LARK_BASE_URL}/task/v2/tasklists",
+            headers=self._headers(),
+            params={"page_size": 1},
+        )
+        self._check_response(response)
 
     def get_tasklist(self, tasklist_guid: str) -> dict:
         self._check_token()
-        with httpx.Client() as client:
-            response = client.get(
-                f"{LARK_BASE_URL}/task/v2/tasklists/{tasklist_guid}",
-                headers=self._headers(),
-            )
-            self._check_response(response)
-            return response.json()
+        response = self._http.get(
+            f"{LARK_BASE_URL}/task/v2/tasklists/{tasklist_guid}",
+            headers=self._headers(),
+        )
+        self._check_response(response)
+        return fastjson.loads(response.content)
 
     def list_sections(self, tasklist_guid: str, page_size: int = 50) -> dict:
         self._check_token()
-        with httpx.Client() as client:
-            response = client.get(
-                f"{LARK_BASE_URL}/task/v2/sections",
-                headers=self._headers(),
-                params={
-                    "resource_type": "tasklist",
-                    "resource_id": tasklist_guid,
-                    "page_size": page_size,
-                },
-            )
-            self._check_response(response)
-            return response.json()
+        response = self._http.get(
+            f"{LARK_BASE_URL}/task/v2/sections",
+            headers=self._headers(),
+            params={
+                "resource_type": "tasklist",
+                "resource_id": tasklist_guid,
+                "page_size": page_size,
+            },
+        )
+        self._check_response(response)
+        return fastjson.loads(response.content)
 
     def list_tasks_in_section(self, section_guid: str, page_size: int = 50) -> dict:
         self._check_token()
-        with httpx.Client() as client:
-            response = client.get(
-                f"{LARK_BASE_URL}/task/v2/sections/{section_guid}/tasks",
-                headers=self._headers(),
-                params={"page_size": page_size},
-            )
-            self._check_response(response)
-            return response.json()
+        response = self._http.get(
+            f"{LARK_BASE_URL}/task/v2/sections/{section_guid}/tasks",
+            headers=self._headers(),
+            params={"page_size": page_size},
+        )
+        self._check_response(response)
+        return fastjson.loads(response.content)
 
     def get_task(self, task_guid: str) -> dict:
         self._check_token()
-        with httpx.Client(timeout=60) as client:
-            response = client.get(
-                f"{LARK_BASE_URL}/task/v2/tasks/{task_guid}",
+        response = self._http.get(
+            f"{LARK_BASE_URL}/task/v2/tasks/{task_guid}",
+            headers=self._headers(),
+            timeout=60,
+        )
+        self._check_response(response)
+        return fastjson.loads(response.content)
+
+    def iter_task_comments(self, task_guid: str, page_size: int = 50) -> Iterator[dict]:
+        """Yield task comments one at a time, fetching pages lazily."""
+        self._check_token()
+        page_token = None
+        while True:
+            params = {
+                "resource_type": "task",
+                "resource_id": task_guid,
+                "page_size": page_size,
+            }
+            if page_token:
+                params["page_token"] = page_token
+            response = self._http.get(
+                f"{LARK_BASE_URL}/task/v2/comments",
                 headers=self._headers(),
+                params=params,
+                timeout=60,
             )
             self._check_response(response)
-            return response.json()
+            data = fastjson.loads(response.content)
+            if data.get("code") != 0:
+                return
+            page = data.get("data", {})
+            yield from page.get("items", [])
+            page_token = page.get("page_token")
+            if not page_token or not page.get("has_more", False):
+                return
 
     def list_task_comments(self, task_guid: str, page_size: int = 50) -> list:
-        self._check_token()
-        all_comments = []
-        page_token = None
-        with httpx.Client(timeout=60) as client:
-            while True:
-                params = {
-                    "resource_type": "task",
-                    "resource_id": task_guid,
-                    "page_size": page_size,
-                }
-                if page_token:
-                    params["page_token"] = page_token
-                response = client.get(
-                    f"{LARK_BASE_URL}/task/v2/comments",
-                    headers=self._headers(),
-                    params=params,
-                )
-                self._check_response(response)
-                data = response.json()
-                if data.get("code") != 0:
-                    break
-                items = data.get("data", {}).get("items", [])
-                all_comments.extend(items)
-                page_token = data.get("data", {}).get("page_token")
-                if not page_token or not data.get("data", {}).get("has_more", False):
-                    break
-        return all_comments
+        return list(self.iter_task_comments(task_guid, page_size=page_size))
 
     def list_attachments(self, resource_type: str, resource_id: str, page_size: int = 50) -> list:
         self._check_token()
         all_attachments = []
         page_token = None
-        with httpx.Client(timeout=60) as client:
-            while True:
-                params = {
-                    "resource_type": resource_type,
-                    "resource_id": resource_id,
-                    "page_size": page_size,
-                }
-                if page_token:
-                    params["page_token"] = page_token
-                response = client.get(
-                    f"{LARK_BASE_URL}/task/v2/attachments",
-                    headers=self._headers(),
-                    params=params,
-                )
-                self._check_response(response)
-                data = response.json()
-                if data.get("code") != 0:
-                    break
-                items = data.get("data", {}).get("items", [])
-                all_attachments.extend(items)
-                page_token = data.get("data", {}).get("page_token")
-                if not page_token or not data.get("data", {}).get("has_more", False):
-                    break
+        while True:
+            params = {
+                "resource_type": resource_type,
+                "resource_id": resource_id,
+                "page_size": page_size,
+            }
+            if page_token:
+                params["page_token"] = page_token
+            response = self._http.get(
+                f"{LARK_BASE_URL}/task/v2/attachments",
+                headers=self._headers(),
+                params=params,
+                timeout=60,
+            )
+            self._check_response(response)
+            data = fastjson.loads(response.content)
+            if data.get("code") != 0:
+                break
+            items = data.get("data", {}).get("items", [])
+            all_attachments.extend(items)
+            page_token = data.get("data", {}).get("page_token")
+            if not page_token or not data.get("data", {}).get("has_more", False):
+                break
         return all_attachments
 
     def get_attachment(self, attachment_guid: str) -> dict:
         self._check_token()
-        with httpx.Client(timeout=60) as client:
-            response = client.get(
-                f"{LARK_BASE_URL}/task/v2/attachments/{attachment_guid}",
-                headers=self._headers(),
-            )
-            self._check_response(response)
-            return response.json()
+        response = self._http.get(
+            f"{LARK_BASE_URL}/task/v2/attachments/{attachment_guid}",
+            headers=self._headers(),
+            timeout=60,
+        )
+        self._check_response(response)
+        return fastjson.loads(response.content)
 
     @staticmethod
     def _text_to_rich_content(text: str) -> str:
@@ -324,22 +348,21 @@ class LarkClient:
     def create_comment(self, task_guid: str, content: str) -> dict:
         self._check_token()
         rich_content = self._text_to_rich_content(content)
-        with httpx.Client(timeout=60) as client:
-            response = client.post(
-                f"{LARK_BASE_URL}/task/v2/comments",
-                headers=self._headers(),
-                json={
-                    "content": content,
-                    "rich_content": rich_content,
-                    "resource_type": "task",
-                    "resource_id": task_guid,
-                },
-            )
-            self._check_response(response)
-            return response.json()
+        response = self._http.post(
+            f"{LARK_BASE_URL}/task/v2/comments",
+            headers=self._headers(),
+            json={
+                "content": content,
+                "rich_content": rich_content,
+                "resource_type": "task",
+                "resource_id": task_guid,
+            },
+            timeout=60,
+        )
+        self._check_response(response)
+        return fastjson.loads(response.content)
 
     def download_file(self, url: str) -> bytes:
-        with httpx.Client(timeout=120, follow_redirects=True) as client:
-            response = client.get(url)
-            response.raise_for_status()
-            return response.content
+        response = self._http.get(url, timeout=120, follow_redirects=True)
+        response.raise_for_status()
+        return response.content
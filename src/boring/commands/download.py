@@ -2,18 +2,66 @@
 
 import os
 import re
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import click
-import httpx
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 
 from .. import config
 from ..backends import get_backend
 
 console = Console()
 
+# Upper bound on tasks saved concurrently (attachment downloads + file writes)
+MAX_WRITE_WORKERS = 32
+
+
+# Write buffer for description.md; large descriptions go out in few syscalls
+WRITE_BUFFER_SIZE = 65536
+
+
+def _mkdir(path: str) -> None:
+    """Create a single directory level, ignoring it if it already exists."""
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        pass
+
+
+def _write_task(bugs_dir: str, task_item) -> None:
+    """Save a task's description and image attachments under bugs_dir/<id>/.
+
+    ``bugs_dir`` must already exist.
+    """
+    import httpx
+
+    task_dir = os.path.join(bugs_dir, task_item.id)
+    _mkdir(task_dir)
+
+    image_links = []
+    if task_item.attachments:
+        images_dir = os.path.join(task_dir, "images")
+        _mkdir(images_dir)
+        for idx, att in enumerate(task_item.attachments):
+            att_name = att.get("name", f"image_{idx}")
+            att_url = att.get("url", "")
+            if att_url:
+                try:
+                    with httpx.Client(timeout=120, follow_redirects=True) as http_client:
+                        resp = http_client.get(att_url)
+                        resp.raise_for_status()
+                        file_path = os.path.join(images_dir, att_name)
+                        with open(file_path, "wb") as img_f:
+                            img_f.write(resp.content)
+                        rel_path = f"images/{att_name}"
+                        image_links.append(f"![{att_name}]({rel_path})")
+                except Exception:
+                    pass
+
+    md_path = os.path.join(task_dir, "description.md")
+    with open(md_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        task_item.render_to(f, image_links)
+
 
 @click.command()
 @click.option("--labels", default=None, help="Comma-separated labels to filter")
@@ -21,6 +69,8 @@ console = Console()
 @click.option("--dir", "bugs_dir_option", default=None, help="Output directory (overrides config)")
 def download(labels: str, section: str, bugs_dir_option: str):
     """Download tasks/cards and save as markdown files."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+
     if not config.is_configured():
         console.print("[bold red]CLI not configured.[/bold red] Run 'boring setup' first.")
         raise click.Abort()
@@ -97,40 +147,21 @@ def download(labels: str, section: str, bugs_dir_option: str):
     ) as progress:
         download_task = progress.add_task(f"Downloading {item_label}s...", total=len(tasks))
 
-        for task_item in tasks:
-            progress.update(download_task, description=f"Saving {task_item.id[:8]}...")
-
-            task_dir = Path(bugs_dir) / task_item.id
-            task_dir.mkdir(parents=True, exist_ok=True)
-
-            description = task_item.description
-            if task_item.attachments:
-                images_dir = task_dir / "images"
-                images_dir.mkdir(parents=True, exist_ok=True)
-                for idx, att in enumerate(task_item.attachments):
-                    att_name = att.get("name", f"image_{idx}")
-                    att_url = att.get("url", "")
-                    if att_url:
-                        try:
-                            with httpx.Client(timeout=120, follow_redirects=True) as http_client:
-                                resp = http_client.get(att_url)
-                                resp.raise_for_status()
-                                file_path = images_dir / att_name
-                                with open(file_path, "wb") as img_f:
-                                    img_f.write(resp.content)
-                                rel_path = f"images/{att_name}"
-                                description = description.replace(
-                                    "[Image]", f"![{att_name}]({rel_path})", 1
-                                )
-                        except Exception:
-                            pass
-
-            md_path = task_dir / "description.md"
-            with open(md_path, "w", encoding="utf-8") as f:
-                f.write(description)
-
-            downloaded_count += 1
-            progress.advance(download_task)
-            console.print(f"  [dim]Saved: {task_item.title[:50]}...[/dim]")
+        # Each task is saved independently, so overlap the attachment downloads
+        # and file writes on a thread pool.
+        with ThreadPoolExecutor(max_workers=min(MAX_WRITE_WORKERS, len(tasks))) as executor:
+            futures = {
+                executor.submit(_write_task, bugs_dir, task_item): task_item
+                for task_item in tasks
+            }
+            for future in as_completed(futures):
+                task_item = futures[future]
+                future.result()
+
+                downloaded_count += 1
+                progress.update(
+                    download_task, description=f"Saved {task_item.id[:8]}...", advance=1
+                )
+                console.print(f"  [dim]Saved: {task_item.title[:50]}...[/dim]")
 
     console.print(f"\n[bold green]Done![/bold green] {downloaded_count} {item_label}(s) saved to '{bugs_dir}/'")
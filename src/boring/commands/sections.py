@@ -1,5 +1,7 @@
 """Sections command for Boring CLI."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import click
 from rich.console import Console
 from rich.table import Table
@@ -9,6 +11,9 @@ from ..backends import get_backend
 
 console = Console()
 
+# Upper bound on boards whose sections are fetched concurrently
+MAX_FETCH_WORKERS = 8
+
 
 @click.command()
 def sections():
@@ -36,29 +41,36 @@ def sections():
             console.print(f"[yellow]No {board_label.lower()}s found.[/yellow]")
             return
 
-        for board in boards:
-            console.print(f"[bold cyan]{board_label}:[/bold cyan] {board.name}")
-            console.print(f"[dim]ID: {board.id}[/dim]\n")
+        # Fetch every board's sections concurrently, then render in board order
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(boards))) as executor:
+            section_futures = [
+                (board, executor.submit(backend.list_sections, board.id))
+                for board in boards
+            ]
+
+            for board, sections_future in section_futures:
+                console.print(f"[bold cyan]{board_label}:[/bold cyan] {board.name}")
+                console.print(f"[dim]ID: {board.id}[/dim]\n")
 
-            try:
-                sections = backend.list_sections(board.id)
+                try:
+                    sections = sections_future.result()
 
-                if not sections:
-                    console.print(f"  [dim]No {section_label.lower()}s[/dim]\n")
-                    continue
+                    if not sections:
+                        console.print(f"  [dim]No {section_label.lower()}s[/dim]\n")
+                        continue
 
-                table = Table(show_header=True, header_style="bold")
-                table.add_column(f"{section_label} Name", style="green")
-                table.add_column("ID", style="dim")
+                    table = Table(show_header=True, header_style="bold")
+                    table.add_column(f"{section_label} Name", style="green")
+                    table.add_column("ID", style="dim")
 
-                for section in sections:
-                    table.add_row(section.name, section.id)
+                    for section in sections:
+                        table.add_row(section.name, section.id)
 
-                console.print(table)
-                console.print()
+                    console.print(table)
+                    console.print()
 
-            except Exception as e:
-                console.print(f"  [yellow]Error fetching {section_label.lower()}s: {e}[/yellow]")
+                except Exception as e:
+                    console.print(f"  [yellow]Error fetching {section_label.lower()}s: {e}[/yellow]")
 
     except Exception as e:
         console.print(f"[bold red]Failed to fetch {board_label.lower()}s:[/bold red] {e}")
@@ -4,17 +4,18 @@ import webbrowser
 
 import click
 from rich.console import Console
-from rich.table import Table
-from rich.prompt import Prompt
 
 from .. import config
-from ..backends import LarkBackend, KanbanBackend
 
 console = Console()
 
 
 def setup_lark():
     """Setup Lark backend with auto-discovery."""
+    from rich.prompt import Prompt
+    from rich.table import Table
+
+    from ..backends.lark import LarkBackend
     from ..client import APIClient
 
     console.print("\n[bold cyan]Lark Suite Setup[/bold cyan]")
@@ -166,6 +167,11 @@ def setup_lark():
 
 def setup_kanban():
     """Setup Kanban backend with auto-discovery."""
+    from rich.prompt import Prompt
+    from rich.table import Table
+
+    from ..backends.kanban import KanbanBackend
+
     console.print("\n[bold cyan]Kanban (Outline) Setup[/bold cyan]")
 
     # Server URL (Common for all backends)
@@ -304,6 +310,8 @@ def setup_kanban():
 @click.command()
 def setup():
     """Configure the CLI with Lark or Kanban backend."""
+    from rich.prompt import Prompt
+
     console.print("\n[bold blue]Boring CLI Setup[/bold blue]")
     console.print("\nSelect task management backend:")
     console.print("  [cyan]1.[/cyan] Lark Suite")
@@ -2,6 +2,7 @@
 
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 import click
 from rich.console import Console
@@ -11,18 +12,24 @@ from ..backends import get_backend
 
 console = Console()
 
+# Number of solved task folders deleted concurrently
+MAX_REMOVE_WORKERS = 4
+
 
 def get_task_folders(bugs_dir: str) -> list:
     """Get all task folders from the bugs directory."""
-    folders = []
-    if not os.path.exists(bugs_dir):
-        return folders
-    for name in os.listdir(bugs_dir):
-        path = os.path.join(bugs_dir, name)
-        # Check if it's a directory and looks like an ID (could be UUID or other format)
-        if os.path.isdir(path) and name.strip():
-            folders.append((name, path))
-    return folders
+    try:
+        with os.scandir(bugs_dir) as entries:
+            # Any non-blank, non-hidden directory name counts as an ID (UUID or
+            # other format); hidden entries such as .git or .idea are never
+            # tasks. scandir's d_type answers is_dir() without a stat per entry.
+            return [
+                (entry.name, entry.path)
+                for entry in entries
+                if entry.name[0] != "." and not entry.name.isspace() and entry.is_dir()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
 
 
 @click.command()
@@ -74,36 +81,52 @@ def solve(keep: bool):
         console.print(f"[bold red]Failed to initialize backend:[/bold red] {e}")
         raise click.Abort()
 
-    success_count = 0
-
+    # Per-task results are collected and rendered in one console.print
+    lines = []
+    comments = {}
+    pending = []
     for task_id, folder_path in task_folders:
         try:
-            comment = None
             fix_summary_path = os.path.join(folder_path, "fix-summary.md")
             if os.path.exists(fix_summary_path):
                 with open(fix_summary_path, "r") as f:
-                    comment = f.read().strip()
-
-            success = backend.move_task(
-                task_id=task_id,
-                from_section_id=from_section_id,
-                to_section_id=to_section_id,
-                comment=comment,
-            )
-
-            if success:
-                if comment:
-                    console.print(f"[green]OK[/green] - {task_id} (comment posted)")
+                    comments[task_id] = f.read().strip()
+            pending.append((task_id, folder_path))
+        except Exception as e:
+            lines.append(f"[red]ERROR[/red] - {task_id}: {e}")
+
+    results = backend.move_tasks_batch(
+        [task_id for task_id, _ in pending],
+        from_section_id=from_section_id,
+        to_section_id=to_section_id,
+        comments=comments,
+    )
+
+    success_count = 0
+    removals = []
+
+    with ThreadPoolExecutor(max_workers=MAX_REMOVE_WORKERS) as rm_pool:
+        for task_id, folder_path in pending:
+            result = results.get(task_id, False)
+            if isinstance(result, Exception):
+                lines.append(f"[red]ERROR[/red] - {task_id}: {result}")
+            elif result:
+                if comments.get(task_id):
+                    lines.append(f"[green]OK[/green] - {task_id} (comment posted)")
                 else:
-                    console.print(f"[green]OK[/green] - {task_id}")
+                    lines.append(f"[green]OK[/green] - {task_id}")
                 if not keep:
-                    shutil.rmtree(folder_path)
+                    removals.append((task_id, rm_pool.submit(shutil.rmtree, folder_path)))
                 success_count += 1
             else:
-                console.print(f"[red]FAIL[/red] - {task_id}: Move operation failed")
-        except Exception as e:
-            console.print(f"[red]ERROR[/red] - {task_id}: {e}")
+                lines.append(f"[red]FAIL[/red] - {task_id}: Move operation failed")
+
+    for task_id, future in removals:
+        error = future.exception()
+        if error is not None:
+            lines.append(f"[red]ERROR[/red] - {task_id}: could not remove folder: {error}")
 
-    console.print(
+    lines.append(
         f"\n[bold green]Done![/bold green] Moved {success_count}/{len(task_folders)} {item_label}(s) to Done/Solved."
     )
+    console.print("\n".join(lines))
@@ -8,12 +8,38 @@ from .. import config
 
 console = Console()
 
+OK_MARKUP = "[green]OK[/green]"
+MISSING_MARKUP = "[red]Missing[/red]"
+OPTIONAL_MARKUP = "[yellow]Optional[/yellow]"
+NOT_SET_MARKUP = "[dim]Not set[/dim]"
+
+# Table rows as (label, config key, required, characters shown before "...")
+COMMON_FIELDS = (
+    ("Bugs Directory", "bugs_dir", True, None),
+)
+LARK_FIELDS = COMMON_FIELDS + (
+    ("Server URL", "server_url", True, None),
+    ("JWT Token", "jwt_token", True, 20),
+    ("Lark Token", "lark_token", False, 20),
+    ("Tasklist GUID", "tasklist_guid", False, None),
+    ("Section GUID", "section_guid", False, None),
+    ("Solved Section GUID", "solved_section_guid", False, None),
+)
+KANBAN_FIELDS = COMMON_FIELDS + (
+    ("Kanban Base URL", "kanban_base_url", True, None),
+    ("Kanban API Key", "kanban_api_key", True, 20),
+    ("Kanban Board ID", "kanban_board_id", False, None),
+    ("Kanban List ID (In-Progress)", "kanban_list_id", False, None),
+    ("Kanban Done List ID", "kanban_done_list_id", False, None),
+)
+BACKEND_FIELDS = {"lark": LARK_FIELDS, "kanban": KANBAN_FIELDS}
+
 
 @click.command()
 def status():
     """Show current configuration status."""
     cfg = config.load_config()
-    backend_type = cfg.get("backend_type", "lark")
+    backend_type = config.get_backend_type(cfg)
 
     table = Table(title="Boring CLI Configuration")
     table.add_column("Setting", style="cyan")
@@ -21,125 +47,33 @@ def status():
     table.add_column("Status", style="yellow")
 
     # Backend Type
-    table.add_row(
-        "Backend Type",
-        backend_type,
-        "[green]OK[/green]",
-    )
-
-    # Bugs Directory
-    bugs_dir = cfg.get("bugs_dir", "")
-    table.add_row(
-        "Bugs Directory",
-        bugs_dir or "[dim]Not set[/dim]",
-        "[green]OK[/green]" if bugs_dir else "[red]Missing[/red]",
-    )
-
-    # Backend-specific configuration
-    if backend_type == "lark":
-        # Server URL
-        server_url = cfg.get("server_url", "")
-        table.add_row(
-            "Server URL",
-            server_url or "[dim]Not set[/dim]",
-            "[green]OK[/green]" if server_url else "[red]Missing[/red]",
-        )
-
-        # JWT Token
-        jwt_token = cfg.get("jwt_token", "")
-        token_display = f"{jwt_token[:20]}..." if jwt_token else "[dim]Not set[/dim]"
-        table.add_row(
-            "JWT Token",
-            token_display,
-            "[green]OK[/green]" if jwt_token else "[red]Missing[/red]",
-        )
-
-        # Lark Token
-        lark_token = cfg.get("lark_token", "")
-        lark_token_display = f"{lark_token[:20]}..." if lark_token else "[dim]Not set[/dim]"
-        table.add_row(
-            "Lark Token",
-            lark_token_display,
-            "[green]OK[/green]" if lark_token else "[yellow]Optional[/yellow]",
-        )
-
-        # Tasklist GUID
-        tasklist_guid = cfg.get("tasklist_guid", "")
-        table.add_row(
-            "Tasklist GUID",
-            tasklist_guid or "[dim]Not set[/dim]",
-            "[green]OK[/green]" if tasklist_guid else "[yellow]Optional[/yellow]",
-        )
-
-        # Section GUID
-        section_guid = cfg.get("section_guid", "")
-        table.add_row(
-            "Section GUID",
-            section_guid or "[dim]Not set[/dim]",
-            "[green]OK[/green]" if section_guid else "[yellow]Optional[/yellow]",
-        )
-
-        # Solved Section GUID
-        solved_section_guid = cfg.get("solved_section_guid", "")
-        table.add_row(
-            "Solved Section GUID",
-            solved_section_guid or "[dim]Not set[/dim]",
-            "[green]OK[/green]" if solved_section_guid else "[yellow]Optional[/yellow]",
-        )
-
-    elif backend_type == "kanban":
-        # Kanban Base URL
-        kanban_base_url = cfg.get("kanban_base_url", "")
-        table.add_row(
-            "Kanban Base URL",
-            kanban_base_url or "[dim]Not set[/dim]",
-            "[green]OK[/green]" if kanban_base_url else "[red]Missing[/red]",
-        )
-
-        # Kanban API Key
-        kanban_api_key = cfg.get("kanban_api_key", "")
-        api_key_display = f"{kanban_api_key[:20]}..." if kanban_api_key else "[dim]Not set[/dim]"
-        table.add_row(
-            "Kanban API Key",
-            api_key_display,
-            "[green]OK[/green]" if kanban_api_key else "[red]Missing[/red]",
-        )
-
-        # Kanban Board ID
-        kanban_board_id = cfg.get("kanban_board_id", "")
-        table.add_row(
-            "Kanban Board ID",
-            kanban_board_id or "[dim]Not set[/dim]",
-            "[green]OK[/green]" if kanban_board_id else "[yellow]Optional[/yellow]",
-        )
-
-        # Kanban List ID (in-progress)
-        kanban_list_id = cfg.get("kanban_list_id", "")
-        table.add_row(
-            "Kanban List ID (In-Progress)",
-            kanban_list_id or "[dim]Not set[/dim]",
-            "[green]OK[/green]" if kanban_list_id else "[yellow]Optional[/yellow]",
-        )
-
-        # Kanban Done List ID
-        kanban_done_list_id = cfg.get("kanban_done_list_id", "")
-        table.add_row(
-            "Kanban Done List ID",
-            kanban_done_list_id or "[dim]Not set[/dim]",
-            "[green]OK[/green]" if kanban_done_list_id else "[yellow]Optional[/yellow]",
-        )
+    table.add_row("Backend Type", backend_type, OK_MARKUP)
+
+    for label, key, required, truncate in BACKEND_FIELDS.get(backend_type, COMMON_FIELDS):
+        value = cfg.get(key, "")
+        if not value:
+            display = NOT_SET_MARKUP
+        elif truncate:
+            display = f"{value[:truncate]}..."
+        else:
+            display = value
+        if value:
+            state = OK_MARKUP
+        else:
+            state = MISSING_MARKUP if required else OPTIONAL_MARKUP
+        table.add_row(label, display, state)
 
     console.print()
     console.print(table)
     console.print()
 
-    if config.is_configured():
+    if config.is_configured_from(cfg):
         console.print("[bold green]CLI is properly configured![/bold green]")
 
         # Try to validate backend connection
         try:
-            from ..backends import get_backend
-            backend = get_backend()
+            from ..backends import get_backend_from
+            backend = get_backend_from(cfg)
             is_valid, error_msg = backend.validate_config()
             if is_valid:
                 console.print(f"[bold green]✓[/bold green] Backend connection validated successfully")
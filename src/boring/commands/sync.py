@@ -1,22 +1,112 @@
 """Sync Claude configuration from server."""
 
-import json
+import configparser
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, Optional
 
 import click
 from rich.console import Console
 
-from ..client import APIClient
+from .. import fastjson
 from ..config import get_value
 
+try:
+    import pygit2
+except ImportError:  # pragma: no cover - depends on optional extra
+    pygit2 = None
+
 console = Console()
 
+# Number of files written concurrently by _sync_config
+MAX_WRITE_WORKERS = 8
+
+# os.open flags for synced files; O_BINARY stops newline translation on Windows
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _find_git_root() -> Optional[Path]:
+    """Walk up from the working directory to the folder containing ``.git``."""
+    cwd = Path.cwd()
+    for path in (cwd, *cwd.parents):
+        if os.path.lexists(path / ".git"):
+            return path
+    return None
+
+
+def _read_origin_url(git_root: Path) -> Optional[str]:
+    """Read the origin remote URL straight from ``.git/config``.
+
+    Returns None whenever git itself might answer differently (worktrees and
+    submodules with a ``.git`` file, includes, ``insteadOf`` rewrites, repeated
+    keys), so the caller can fall back to asking git.
+    """
+    config_path = git_root / ".git" / "config"
+    # strict: a repeated key raises instead of keeping the last value, whereas
+    # git reports the first ``url`` of a remote
+    parser = configparser.ConfigParser(strict=True, interpolation=None)
+    try:
+        if not parser.read(config_path):
+            return None
+    except configparser.Error:
+        return None
+    for section in parser.sections():
+        if section.startswith(("include", 'url "')):
+            return None
+    return parser.get('remote "origin"', "url", fallback=None)
+
+
+def _repo_name_from_url(remote_url: str) -> str:
+    """Extract the repository name from an HTTPS or SSH remote URL."""
+    if remote_url.endswith(".git"):
+        remote_url = remote_url[:-4]
+
+    # Handle SSH format: git@github.com:user/repo
+    if ":" in remote_url and "@" in remote_url:
+        return remote_url.split(":")[-1].split("/")[-1]
+    # Handle HTTPS format: https://github.com/user/repo
+    return remote_url.split("/")[-1]
+
+
+def _git_env_overridden() -> bool:
+    """Whether git's repository discovery is redirected by the environment."""
+    return "GIT_DIR" in os.environ or "GIT_WORK_TREE" in os.environ
+
+
+def _read_origin_url_pygit2() -> Optional[str]:
+    """Resolve the origin URL in-process with libgit2, if pygit2 is installed.
+
+    Unlike the plain ``.git/config`` read this understands worktrees,
+    submodules, config includes and ``insteadOf`` rewrites.
+    """
+    if pygit2 is None:
+        return None
+    try:
+        repo_path = pygit2.discover_repository(os.getcwd())
+        if not repo_path:
+            return None
+        repo = pygit2.Repository(repo_path)
+        # libgit2 keeps the last of several urls where git reports the first
+        if len(list(repo.config.get_multivar("remote.origin.url"))) > 1:
+            return None
+        return repo.remotes["origin"].url
+    except (KeyError, pygit2.GitError):
+        return None
+
 
 def get_git_repo_name() -> Optional[str]:
     """Get repository name from git remote URL."""
+    if not _git_env_overridden():
+        git_root = _find_git_root()
+        remote_url = _read_origin_url(git_root) if git_root else None
+        if not remote_url:
+            remote_url = _read_origin_url_pygit2()
+        if remote_url:
+            return _repo_name_from_url(remote_url.strip())
+
     try:
         result = subprocess.run(
             ["git", "remote", "get-url", "origin"],
@@ -24,27 +114,18 @@ def get_git_repo_name() -> Optional[str]:
             text=True,
             check=True,
         )
-        remote_url = result.stdout.strip()
-
-        # Extract repo name from URL
-        # Handle both HTTPS and SSH URLs
-        if remote_url.endswith(".git"):
-            remote_url = remote_url[:-4]
-
-        # Handle SSH format: git@github.com:user/repo
-        if ":" in remote_url and "@" in remote_url:
-            repo_name = remote_url.split(":")[-1].split("/")[-1]
-        else:
-            # Handle HTTPS format: https://github.com/user/repo
-            repo_name = remote_url.split("/")[-1]
-
-        return repo_name
-    except subprocess.CalledProcessError:
+        return _repo_name_from_url(result.stdout.strip())
+    except (subprocess.CalledProcessError, FileNotFoundError):
         return None
 
 
 def get_git_root() -> Optional[Path]:
     """Get the root directory of the git repository."""
+    if not _git_env_overridden():
+        git_root = _find_git_root()
+        if git_root:
+            return git_root
+
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],
@@ -53,7 +134,7 @@ def get_git_root() -> Optional[Path]:
             check=True,
         )
         return Path(result.stdout.strip())
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, FileNotFoundError):
         return None
 
 
@@ -74,6 +155,8 @@ def sync(repo: Optional[str], machine: Optional[str], dry_run: bool):
       boring sync -m macbook-pro     # Use machine-specific paths
       boring sync --dry-run          # Preview changes
     """
+    from ..client import APIClient
+
     # Auto-detect repo name
     if not repo:
         repo = get_git_repo_name()
@@ -113,87 +196,126 @@ def sync(repo: Optional[str], machine: Optional[str], dry_run: bool):
     console.print("\n[green]✓ Sync complete![/green]")
 
 
-def _show_dry_run(config: dict, claude_dir: Path):
-    """Show what would be synced."""
-    if config.get("claude_md"):
-        console.print(f"  • {claude_dir / 'CLAUDE.md'}")
-
-    if config.get("settings_json"):
-        console.print(f"  • {claude_dir / 'settings.local.json'}")
-
-    if config.get("mcp_json", {}).get("mcpServers"):
-        console.print(f"  • {claude_dir.parent / '.mcp.json'}")
-
-    for agent in config.get("agents", []):
-        console.print(f"  • {claude_dir / 'agents' / f'{agent['name']}.md'}")
+@dataclass
+class _SyncFile:
+    """One file produced by a sync, as yielded by ``_walk``."""
 
-    for skill in config.get("skills", []):
-        console.print(f"  • {claude_dir / 'skills' / skill['name'] / 'SKILL.md'}")
-        for script in skill.get("scripts", []):
-            console.print(f"    • {claude_dir / 'skills' / skill['name'] / 'scripts' / script['filename']}")
+    path: str
+    label: str
+    indent: str
+    content: Any
+    as_json: bool = False
+    executable: bool = False
 
-    for command in config.get("commands", []):
-        console.print(f"  • {claude_dir / 'commands' / f'{command['name']}.md'}")
+    def payload(self) -> bytes:
+        """Encode the file contents for writing."""
+        if self.as_json:
+            return fastjson.dumps(self.content, indent=True) + b"\n"
+        return self.content.encode("utf-8")
 
 
-def _sync_config(config: dict, claude_dir: Path):
-    """Write configuration files to disk."""
-    # Create directories
-    claude_dir.mkdir(exist_ok=True)
-    (claude_dir / "agents").mkdir(exist_ok=True)
-    (claude_dir / "skills").mkdir(exist_ok=True)
-    (claude_dir / "commands").mkdir(exist_ok=True)
+def _walk(config: dict, claude_dir: Path) -> Iterator[_SyncFile]:
+    """Yield every file a sync of ``config`` into ``claude_dir`` would write."""
+    # Plain string paths from here on: the loops below join many of them
+    claude_dir_s = os.fspath(claude_dir)
+    agents_dir = os.path.join(claude_dir_s, "agents")
+    skills_dir = os.path.join(claude_dir_s, "skills")
+    commands_dir = os.path.join(claude_dir_s, "commands")
 
-    # Write CLAUDE.md
     if config.get("claude_md"):
-        claude_md_path = claude_dir / "CLAUDE.md"
-        claude_md_path.write_text(config["claude_md"])
-        console.print(f"  [green]✓[/green] CLAUDE.md")
+        yield _SyncFile(
+            os.path.join(claude_dir_s, "CLAUDE.md"), "CLAUDE.md", "  ", config["claude_md"]
+        )
 
-    # Write settings.local.json
     if config.get("settings_json"):
-        settings_path = claude_dir / "settings.local.json"
-        settings_path.write_text(json.dumps(config["settings_json"], indent=2) + "\n")
-        console.print(f"  [green]✓[/green] settings.local.json")
+        yield _SyncFile(
+            os.path.join(claude_dir_s, "settings.local.json"),
+            "settings.local.json",
+            "  ",
+            config["settings_json"],
+            as_json=True,
+        )
 
-    # Write .mcp.json (in repo root, not .claude)
+    # .mcp.json lives in the repo root, not .claude
     if config.get("mcp_json", {}).get("mcpServers"):
-        mcp_path = claude_dir.parent / ".mcp.json"
-        mcp_path.write_text(json.dumps(config["mcp_json"], indent=2) + "\n")
-        console.print(f"  [green]✓[/green] .mcp.json")
+        yield _SyncFile(
+            os.path.join(os.path.dirname(claude_dir_s), ".mcp.json"),
+            ".mcp.json",
+            "  ",
+            config["mcp_json"],
+            as_json=True,
+        )
 
-    # Write agents
     for agent in config.get("agents", []):
-        agent_path = claude_dir / "agents" / f"{agent['name']}.md"
-        agent_path.write_text(agent["content"])
-        console.print(f"  [green]✓[/green] agents/{agent['name']}.md")
+        file_name = f"{agent['name']}.md"
+        yield _SyncFile(
+            os.path.join(agents_dir, file_name), f"agents/{file_name}", "  ", agent["content"]
+        )
 
-    # Write skills
     for skill in config.get("skills", []):
-        skill_dir = claude_dir / "skills" / skill["name"]
-        skill_dir.mkdir(exist_ok=True)
+        skill_dir = os.path.join(skills_dir, skill["name"])
+        yield _SyncFile(
+            os.path.join(skill_dir, "SKILL.md"),
+            f"skills/{skill['name']}/SKILL.md",
+            "  ",
+            skill["skill_md"],
+        )
+
+        scripts_dir = os.path.join(skill_dir, "scripts")
+        for script in skill.get("scripts", []):
+            yield _SyncFile(
+                os.path.join(scripts_dir, script["filename"]),
+                f"scripts/{script['filename']}",
+                "    ",
+                script["content"],
+                executable=bool(script.get("is_executable")),
+            )
+
+    for command in config.get("commands", []):
+        file_name = f"{command['name']}.md"
+        yield _SyncFile(
+            os.path.join(commands_dir, file_name), f"commands/{file_name}", "  ", command["content"]
+        )
 
-        skill_md_path = skill_dir / "SKILL.md"
-        skill_md_path.write_text(skill["skill_md"])
-        console.print(f"  [green]✓[/green] skills/{skill['name']}/SKILL.md")
 
-        # Write scripts
-        if skill.get("scripts"):
-            scripts_dir = skill_dir / "scripts"
-            scripts_dir.mkdir(exist_ok=True)
+def _show_dry_run(config: dict, claude_dir: Path):
+    """Show what would be synced."""
+    for item in _walk(config, claude_dir):
+        console.print(f"{item.indent}• {item.path}")
 
-            for script in skill["scripts"]:
-                script_path = scripts_dir / script["filename"]
-                script_path.write_text(script["content"])
 
-                # Make executable if needed
-                if script.get("is_executable"):
-                    os.chmod(script_path, 0o755)
+def _write_file(path: str, content: bytes) -> None:
+    """Write one synced file straight through a raw file descriptor."""
+    # 0o666 before umask, the same mode open() would create the file with
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
-                console.print(f"    [green]✓[/green] scripts/{script['filename']}")
 
-    # Write commands
-    for command in config.get("commands", []):
-        command_path = claude_dir / "commands" / f"{command['name']}.md"
-        command_path.write_text(command["content"])
-        console.print(f"  [green]✓[/green] commands/{command['name']}.md")
+def _sync_config(config: dict, claude_dir: Path):
+    """Write configuration files to disk."""
+    items = list(_walk(config, claude_dir))
+
+    # Create only the directories that will receive files; makedirs covers
+    # the parents of each.
+    for directory in {os.path.dirname(item.path) for item in items}:
+        os.makedirs(directory, exist_ok=True)
+
+    # File writes go to a pool and are reported in submission order;
+    # executable bits are applied in one pass once every write is done.
+    # Contents are encoded here so worker threads only do the write syscalls.
+    with ThreadPoolExecutor(max_workers=MAX_WRITE_WORKERS) as pool:
+        writes = [
+            (item, pool.submit(_write_file, item.path, item.payload())) for item in items
+        ]
+        for item, future in writes:
+            future.result()
+            console.print(f"{item.indent}[green]✓[/green] {item.label}")
+
+    for item in items:
+        if item.executable:
+            os.chmod(item.path, 0o755)
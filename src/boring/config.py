@@ -6,28 +6,61 @@ from typing import Optional
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _Dumper, CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _Dumper, SafeLoader as _Loader
+
 CONFIG_DIR = Path.home() / ".boring-agents"
 CONFIG_FILE = CONFIG_DIR / "config.yaml"
 
+# Parsed config plus the (mtime_ns, size) of the file it was read from
+_CACHE = {"signature": None, "data": None}
+
 
 def ensure_config_dir() -> None:
     """Ensure the config directory exists."""
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _config_signature() -> Optional[tuple]:
+    """Return (mtime_ns, size) of the config file, or None if it is missing."""
+    try:
+        stat = os.stat(CONFIG_FILE)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
 def load_config() -> dict:
-    """Load configuration from file."""
-    if not CONFIG_FILE.exists():
+    """Load configuration from file.
+
+    The parsed file is cached in-process and re-read only when its
+    modification time or size changes. Callers get a copy they may mutate.
+    """
+    signature = _config_signature()
+    if signature is None:
         return {}
-    with open(CONFIG_FILE, "r") as f:
-        return yaml.safe_load(f) or {}
+    return _load_config_at(signature)
+
+
+def _load_config_at(signature: tuple) -> dict:
+    """Return the config for an existing file, parsing only on a cache miss."""
+    if _CACHE["signature"] != signature:
+        with open(CONFIG_FILE, "r") as f:
+            _CACHE["data"] = yaml.load(f, Loader=_Loader) or {}
+        _CACHE["signature"] = signature
+    return dict(_CACHE["data"])
 
 
 def save_config(config: dict) -> None:
     """Save configuration to file."""
     ensure_config_dir()
     with open(CONFIG_FILE, "w") as f:
-        yaml.dump(config, f, default_flow_style=False)
+        yaml.dump(config, f, Dumper=_Dumper, default_flow_style=False)
+    # Prime the cache with what was just written so the next read is free
+    _CACHE["data"] = dict(config)
+    _CACHE["signature"] = _config_signature()
 
 
 def get_value(key: str) -> Optional[str]:
@@ -38,6 +71,9 @@ def get_value(key: str) -> Optional[str]:
 def set_value(key: str, value: str) -> None:
     """Set a configuration value."""
     config = load_config()
+    # Leave the file (and its mtime) untouched when nothing changes
+    if key in config and config[key] == value:
+        return
     config[key] = value
     save_config(config)
 
@@ -99,9 +135,14 @@ def set_lark_token(token: str) -> None:
     set_value("lark_token", token)
 
 
-def get_backend_type() -> Optional[str]:
-    """Get configured backend type ('lark' or 'kanban')."""
-    return get_value("backend_type") or "lark"  # Default to lark for backward compat
+def get_backend_type(cfg: Optional[dict] = None) -> Optional[str]:
+    """Get configured backend type ('lark' or 'kanban').
+
+    Pass an already loaded ``cfg`` to avoid reading the config again.
+    """
+    if cfg is None:
+        cfg = load_config()
+    return cfg.get("backend_type") or "lark"  # Default to lark for backward compat
 
 
 def set_backend_type(backend_type: str) -> None:
@@ -163,7 +204,15 @@ def set_kanban_done_list_id(list_id: str) -> None:
 
 def is_configured() -> bool:
     """Check if the CLI is properly configured based on backend type."""
-    config_data = load_config()
+    # A fresh install has no config file: answer from the stat alone
+    signature = _config_signature()
+    if signature is None:
+        return False
+    return is_configured_from(_load_config_at(signature))
+
+
+def is_configured_from(config_data: dict) -> bool:
+    """Check an already loaded config dict for a complete backend setup."""
     backend_type = config_data.get("backend_type", "lark")
     bugs_dir = config_data.get("bugs_dir")
 
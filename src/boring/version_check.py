@@ -3,7 +3,6 @@
 import json
 from typing import Optional, Tuple
 
-import httpx
 from packaging import version as pkg_version
 
 from . import __version__
@@ -13,6 +12,8 @@ PYPI_URL = "https://pypi.org/pypi/boring-cli/json"
 
 def get_latest_version() -> Optional[str]:
     """Fetch the latest version from PyPI."""
+    import httpx
+
     try:
         with httpx.Client(timeout=3) as client:
             response = client.get(PYPI_URL)